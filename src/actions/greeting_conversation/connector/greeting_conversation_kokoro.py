@@ -5,6 +5,7 @@ from pydantic import Field
 
 from actions.base import ActionConfig, ActionConnector
 from actions.greeting_conversation.interface import GreetingConversationInput
+from actions.greeting_conversation.speech import estimate_speech_duration
 from providers.context_provider import ContextProvider
 from providers.greeting_conversation_state_provider import (
     ConversationState,
@@ -105,7 +106,7 @@ class GreetingConversationConnector(
         )
         self.tts.start()
 
-        self.tts_triggered_time = time.time()
+        self.tts_triggered_time = time.monotonic()
         self.tts_duration = 0.0  # Estimated TTS duration in seconds
 
     async def connect(self, output_interface: GreetingConversationInput) -> None:
@@ -117,10 +118,10 @@ class GreetingConversationConnector(
         output_interface : GreetingConversationInput
             The output interface containing the greeting conversation data.
         """
-        logging.info(f"Conversation State: {output_interface.conversation_state}")
-        logging.info(f"Greeting Response: {output_interface.response}")
-        logging.info(f"Confidence Score: {output_interface.confidence}")
-        logging.info(f"Speech Clarity Score: {output_interface.speech_clarity}")
+        logging.info("Conversation State: %s", output_interface.conversation_state)
+        logging.info("Greeting Response: %s", output_interface.response)
+        logging.info("Confidence Score: %s", output_interface.confidence)
+        logging.info("Speech Clarity Score: %s", output_interface.speech_clarity)
 
         llm_output = {
             "conversation_state": output_interface.conversation_state,
@@ -131,13 +132,12 @@ class GreetingConversationConnector(
 
         self.tts.add_pending_message(output_interface.response)
 
-        # Estimate TTS duration based on text length (~100 words per minute speech rate)
-        word_count = len(output_interface.response.split())
-        self.tts_duration = (word_count / 100.0) * 60.0  # Convert to seconds
-        self.tts_triggered_time = time.time()
+        # Estimate TTS duration based on text length
+        self.tts_duration = estimate_speech_duration(output_interface.response)
+        self.tts_triggered_time = time.monotonic()
 
         response = self.greeting_state_provider.process_conversation(llm_output)
-        logging.info(f"Greeting Conversation Response: {response}")
+        logging.info("Greeting Conversation Response: %s", response)
 
         if response.get("current_state") == ConversationState.FINISHED:
             logging.info("Greeting conversation has finished.")
@@ -155,9 +155,12 @@ class GreetingConversationConnector(
 
         self.sleep(10)
 
-        if time.time() - self.tts_triggered_time < self.tts_duration:
+        elapsed = time.monotonic() - self.tts_triggered_time
+        if elapsed < self.tts_duration:
             logging.info(
-                f"Skipping tick update due to recent TTS activity (remaining: {self.tts_duration - (time.time() - self.tts_triggered_time):.1f}s)."
+                "Skipping tick update due to recent TTS activity "
+                "(remaining: %.1fs).",
+                self.tts_duration - elapsed,
             )
             return
 
@@ -173,7 +176,8 @@ class GreetingConversationConnector(
 
         # Log the updated state
         logging.info(
-            f"State: {state_update.get('current_state')}, "
-            f"Confidence: {state_update.get('confidence', {}).get('overall', 0):.2f}, "
-            f"Silence: {state_update.get('silence_duration', 0):.1f}s"
+            "State: %s, Confidence: %.2f, Silence: %.1fs",
+            state_update.get("current_state"),
+            state_update.get("confidence", {}).get("overall", 0),
+            state_update.get("silence_duration", 0),
         )
@@ -0,0 +1,22 @@
+# Estimated speech duration per word (~100 words per minute speech rate)
+SECONDS_PER_WORD = 0.6
+
+
+def estimate_speech_duration(text: str) -> float:
+    """
+    Estimate how long TTS takes to speak a text.
+
+    Words are counted by spaces, which avoids building a list per response.
+
+    Parameters
+    ----------
+    text : str
+        The text to be spoken.
+
+    Returns
+    -------
+    float
+        The estimated speech duration in seconds.
+    """
+    word_count = text.count(" ") + 1 if text else 0
+    return word_count * SECONDS_PER_WORD
@@ -1,6 +1,6 @@
-import json
 import logging
 import time
+from typing import Optional
 from uuid import uuid4
 
 import zenoh
@@ -110,6 +110,21 @@ class SpeakKokoroTTSConnector(ActionConnector[SpeakKokoroTTSConfig, SpeakInput])
         self.tts_status_response_topic = "om/tts/response"
         self.session = None
         self.audio_pub = None
+        self._last_published_audio: Optional[bytes] = None
+
+        # Reusable messages mutated in place on every publish
+        self._scratch_audio_status = AudioStatus(
+            header=prepare_header(),
+            status_mic=AudioStatus.STATUS_MIC.UNKNOWN.value,
+            status_speaker=AudioStatus.STATUS_SPEAKER.ACTIVE.value,
+            sentence_to_speak=String(""),
+        )
+        self._scratch_tts_status_response = TTSStatusResponse(
+            header=prepare_header(),
+            request_id=String(""),
+            code=TTSStatusResponse.Code.UNKNOWN.value,
+            status=String(""),
+        )
 
         self.audio_status = AudioStatus(
             header=prepare_header(str(uuid4())),
@@ -130,7 +145,7 @@ class SpeakKokoroTTSConnector(ActionConnector[SpeakKokoroTTSConfig, SpeakInput])
             )
 
             if self.audio_pub:
-                self.audio_pub.put(self.audio_status.serialize())
+                self._publish_audio_status(self.audio_status)
 
             logging.info("Elevenlabs TTS Zenoh client opened")
         except Exception as e:
@@ -174,7 +189,31 @@ class SpeakKokoroTTSConnector(ActionConnector[SpeakKokoroTTSConfig, SpeakInput])
         data : zenoh.Sample
             The Zenoh sample received, which should have a 'payload' attribute.
         """
-        self.audio_status = AudioStatus.deserialize(data.payload.to_bytes())
+        payload = data.payload.to_bytes()
+
+        # Our own publications echo back on the same topic; skip decoding them
+        if payload == self._last_published_audio:
+            return
+
+        self.audio_status = AudioStatus.deserialize(payload)
+
+    def _publish_audio_status(self, audio_status: AudioStatus):
+        """
+        Serialize and publish an audio status message.
+
+        Parameters
+        ----------
+        audio_status : AudioStatus
+            The audio status message to publish.
+        """
+        if self.audio_pub is None:
+            return
+
+        # pycdr2 already serializes through a per-type buffer it reuses,
+        # and always returns a fresh bytes copy, so there is nothing to pool
+        payload = audio_status.serialize()
+        self._last_published_audio = payload
+        self.audio_pub.put(payload)
 
     async def connect(self, output_interface: SpeakInput) -> None:
         """
@@ -197,7 +236,9 @@ class SpeakKokoroTTSConnector(ActionConnector[SpeakKokoroTTSConfig, SpeakInput])
         ):
             self.silence_counter += 1
             logging.info(
-                f"Skipping TTS due to silence_rate {self.silence_rate}, counter {self.silence_counter}"
+                "Skipping TTS due to silence_rate %s, counter %s",
+                self.silence_rate,
+                self.silence_counter,
             )
             return
 
@@ -206,26 +247,25 @@ class SpeakKokoroTTSConnector(ActionConnector[SpeakKokoroTTSConfig, SpeakInput])
         # Add pending message to TTS
         pending_message = self.tts.create_pending_message(output_interface.action)
 
-        # Store robot message to conversation history only if there was ASR input
+        if self.audio_pub:
+            state = self._scratch_audio_status
+            state.header = prepare_header(str(uuid4()))
+            state.status_mic = self.audio_status.status_mic
+            state.sentence_to_speak.data = self.tts.serialize_pending_message(
+                pending_message
+            )
+            self._publish_audio_status(state)
+        else:
+            self.tts.add_pending_message(pending_message)
+
+        # Store robot message to conversation history only if there was ASR input,
+        # after the audio has been handed off
         if (
             self.io_provider.llm_prompt is not None
             and "INPUT: Voice" in self.io_provider.llm_prompt
         ):
             self.conversation_provider.store_robot_message(output_interface.action)
 
-        state = AudioStatus(
-            header=prepare_header(str(uuid4())),
-            status_mic=self.audio_status.status_mic,
-            status_speaker=AudioStatus.STATUS_SPEAKER.ACTIVE.value,
-            sentence_to_speak=String(json.dumps(pending_message)),
-        )
-
-        if self.audio_pub:
-            self.audio_pub.put(state.serialize())
-            return
-
-        self.tts.add_pending_message(pending_message)
-
     def _zenoh_tts_status_request(self, data: zenoh.Sample):
         """
         Process an incoming TTS control status message.
@@ -243,47 +283,52 @@ class SpeakKokoroTTSConnector(ActionConnector[SpeakKokoroTTSConfig, SpeakInput])
 
         # Read the current status
         if code == 2:
-            tts_status_response = TTSStatusResponse(
-                header=prepare_header(tts_status.header.frame_id),
-                request_id=request_id,
-                code=1 if self.tts_enabled else 0,
-                status=String(
-                    data=("TTS Enabled" if self.tts_enabled else "TTS Disabled")
-                ),
-            )
-            return self._zenoh_tts_status_response_pub.put(
-                tts_status_response.serialize()
+            return self._publish_tts_status_response(
+                tts_status.header.frame_id,
+                request_id,
+                1 if self.tts_enabled else 0,
+                "TTS Enabled" if self.tts_enabled else "TTS Disabled",
             )
 
         # Enable the TTS
         if code == 1:
             self.tts_enabled = True
             logging.debug("TTS Enabled")
-
-            ai_status_response = TTSStatusResponse(
-                header=prepare_header(tts_status.header.frame_id),
-                request_id=request_id,
-                code=1,
-                status=String(data="TTS Enabled"),
-            )
-            return self._zenoh_tts_status_response_pub.put(
-                ai_status_response.serialize()
+            return self._publish_tts_status_response(
+                tts_status.header.frame_id, request_id, 1, "TTS Enabled"
             )
 
         # Disable the TTS
         if code == 0:
             self.tts_enabled = False
             logging.debug("TTS Disabled")
-            ai_status_response = TTSStatusResponse(
-                header=prepare_header(tts_status.header.frame_id),
-                request_id=request_id,
-                code=0,
-                status=String(data="TTS Disabled"),
+            return self._publish_tts_status_response(
+                tts_status.header.frame_id, request_id, 0, "TTS Disabled"
             )
 
-            return self._zenoh_tts_status_response_pub.put(
-                ai_status_response.serialize()
-            )
+    def _publish_tts_status_response(
+        self, frame_id: str, request_id: String, code: int, status: str
+    ):
+        """
+        Publish a TTS status response using the reusable response message.
+
+        Parameters
+        ----------
+        frame_id : str
+            The frame ID of the originating request.
+        request_id : String
+            The ID of the originating request.
+        code : int
+            The TTS status code to report.
+        status : str
+            The human-readable TTS status.
+        """
+        response = self._scratch_tts_status_response
+        response.header = prepare_header(frame_id)
+        response.request_id = request_id
+        response.code = code
+        response.status.data = status
+        return self._zenoh_tts_status_response_pub.put(response.serialize())
 
     def stop(self) -> None:
         """
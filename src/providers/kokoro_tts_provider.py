@@ -1,10 +1,12 @@
+import json
 import logging
-from typing import Callable, Optional, Union
-
-from om1_speech import AudioOutputLiveStream
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 from .singleton import singleton
 
+if TYPE_CHECKING:
+    from om1_speech import AudioOutputLiveStream
+
 
 @singleton
 class KokoroTTSProvider:
@@ -57,21 +59,17 @@ class KokoroTTSProvider:
 
         # Initialize TTS provider
         self.running: bool = False
-        self._audio_stream: AudioOutputLiveStream = AudioOutputLiveStream(
-            url=url,
-            tts_model=model_id,
-            tts_voice=voice_id,
-            response_format=output_format,
-            rate=rate,
-            api_key=api_key,
-            enable_tts_interrupt=enable_tts_interrupt,
-        )
 
         # Set TTS parameters
+        self._url = url
         self._voice_id = voice_id
         self._model_id = model_id
         self._output_format = output_format
+        self._rate = rate
         self._enable_tts_interrupt = enable_tts_interrupt
+        self._update_static_fields()
+
+        self._audio_stream: "AudioOutputLiveStream" = self._create_audio_stream()
 
     def configure(
         self,
@@ -106,12 +104,21 @@ class KokoroTTSProvider:
             detects new speech input. Defaults to False.
         """
         restart_needed = (
-            url != self._audio_stream._url
-            or api_key != self.api_key
-            or voice_id != self._voice_id
-            or model_id != self._model_id
-            or output_format != self._output_format
-            or enable_tts_interrupt != self._enable_tts_interrupt
+            url,
+            api_key,
+            voice_id,
+            model_id,
+            output_format,
+            rate,
+            enable_tts_interrupt,
+        ) != (
+            self._url,
+            self.api_key,
+            self._voice_id,
+            self._model_id,
+            self._output_format,
+            self._rate,
+            self._enable_tts_interrupt,
         )
 
         if not restart_needed:
@@ -121,22 +128,50 @@ class KokoroTTSProvider:
             self.stop()
 
         self.api_key = api_key
+        self._url = url
         self._voice_id = voice_id
         self._model_id = model_id
         self._output_format = output_format
+        self._rate = rate
         self._enable_tts_interrupt = enable_tts_interrupt
+        self._update_static_fields()
 
-        self._audio_stream: AudioOutputLiveStream = AudioOutputLiveStream(
-            url=url,
-            tts_model=model_id,
-            tts_voice=voice_id,
-            response_format=output_format,
-            rate=rate,
-            api_key=api_key,
-            enable_tts_interrupt=enable_tts_interrupt,
-        )
+        self._audio_stream = self._create_audio_stream()
         self._audio_stream.start()
 
+    def _create_audio_stream(self) -> "AudioOutputLiveStream":
+        """
+        Create the audio output stream for the current TTS parameters.
+
+        om1_speech is imported here so the module can be imported without it.
+
+        Returns
+        -------
+        AudioOutputLiveStream
+            The audio output stream.
+
+        Raises
+        ------
+        ImportError
+            If the om1_speech package is not installed.
+        """
+        try:
+            from om1_speech import AudioOutputLiveStream
+        except ImportError as e:
+            raise ImportError(
+                "om1_speech not found. Please install the om1-modules package to use Kokoro TTS."
+            ) from e
+
+        return AudioOutputLiveStream(
+            url=self._url,
+            tts_model=self._model_id,
+            tts_voice=self._voice_id,
+            response_format=self._output_format,
+            rate=self._rate,
+            api_key=self.api_key,
+            enable_tts_interrupt=self._enable_tts_interrupt,
+        )
+
     def register_tts_state_callback(self, tts_state_callback: Optional[Callable]):
         """
         Register a callback for TTS state changes.
@@ -163,13 +198,46 @@ class KokoroTTSProvider:
         dict
             A dictionary containing the TTS request parameters.
         """
-        logging.info(f"audio_stream: {text}")
-        return {
-            "text": text,
+        logging.debug("audio_stream: %s", text)
+        return {"text": text, **self._static_fields}
+
+    def serialize_pending_message(self, message: dict) -> str:
+        """
+        Serialize a pending message to a JSON string.
+
+        Messages that only carry the provider's static TTS parameters reuse the
+        pre-serialized fields, so only the text is encoded per call.
+
+        Parameters
+        ----------
+        message : dict
+            The TTS request message.
+
+        Returns
+        -------
+        str
+            The JSON encoded message.
+        """
+        text = message.get("text")
+        if (
+            isinstance(text, str)
+            and len(message) == len(self._static_fields) + 1
+            and all(message.get(k) == v for k, v in self._static_fields.items())
+        ):
+            return f'{{"text": {json.dumps(text)}, {self._static_fields_json}}}'
+
+        return json.dumps(message)
+
+    def _update_static_fields(self):
+        """
+        Pre-serialize the TTS parameters shared by every pending message.
+        """
+        self._static_fields = {
             "voice_id": self._voice_id,
             "model_id": self._model_id,
             "output_format": self._output_format,
         }
+        self._static_fields_json = json.dumps(self._static_fields)[1:-1]
 
     def add_pending_message(self, message: Union[str, dict]):
         """
@@ -26,7 +26,8 @@ def singleton(cls):
         Returns the singleton instance of the decorated class.
 
         If the instance doesn't exist, creates it with the provided arguments.
-        Thread-safe implementation using a lock.
+        Later calls return the existing instance without re-running __init__,
+        and skip the lock once the instance has been created.
 
         Args:
             *args: Positional arguments to pass to the class constructor.
@@ -36,6 +37,10 @@ def singleton(cls):
         -------
             Any: The singleton instance of the decorated class.
         """
+        instance = cls._singleton_instance
+        if instance is not None:
+            return instance
+
         with lock:
             if cls._singleton_instance is None:
                 cls._singleton_instance = cls(*args, **kwargs)
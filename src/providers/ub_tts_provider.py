@@ -1,8 +1,16 @@
 import json
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import queue
+import threading
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Maximum number of TTS requests waiting for the worker thread
+PENDING_QUEUE_SIZE = 32
+
+# Seconds stop() waits for an in-flight TTS request to finish
+STOP_TIMEOUT = 6.0
 
 
 class UbTtsProvider:
@@ -20,9 +28,20 @@ class UbTtsProvider:
             The URL of the Ubtech TTS service.
         """
         self.tts_url = url
-        self.executor = ThreadPoolExecutor(max_workers=1)
         self.headers = {"Content-Type": "application/json"}
 
+        # Reuse pooled connections across TTS requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Single persistent worker draining a bounded request queue
+        self._pending_messages: queue.Queue = queue.Queue(maxsize=PENDING_QUEUE_SIZE)
+        self._stop_event = threading.Event()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
         logging.info(f"Ubtech TTS Provider initialized for URL: {self.tts_url}")
 
     def start(self):
@@ -35,6 +54,10 @@ class UbTtsProvider:
         """
         Add a pending TTS message to be processed asynchronously.
 
+        When the queue is full, an interrupting message replaces the oldest
+        queued message, while a non-interrupting message is dropped. Messages
+        added after stop() are dropped.
+
         Parameters
         ----------
         message : str
@@ -44,13 +67,81 @@ class UbTtsProvider:
         timestamp : int
             A timestamp to identify the TTS request.
         """
-        self.executor.submit(self._speak_workder, message, interrupt, timestamp)
+        if self._stop_event.is_set():
+            logging.warning(f"TTS provider stopped, dropping message: {message}")
+            return
+
+        item = (message, interrupt, timestamp)
+        try:
+            self._pending_messages.put_nowait(item)
+            return
+        except queue.Full:
+            if not interrupt:
+                logging.warning(f"TTS queue full, dropping message: {message}")
+                return
+
+        try:
+            dropped = self._pending_messages.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            if dropped is None:
+                # stop() raced with this call; hand the sentinel back to the worker
+                try:
+                    self._pending_messages.put_nowait(None)
+                except queue.Full:
+                    pass
+                logging.warning(f"TTS provider stopped, dropping message: {message}")
+                return
+            logging.warning(f"TTS queue full, dropping message: {dropped[0]}")
+
+        try:
+            self._pending_messages.put_nowait(item)
+        except queue.Full:
+            logging.warning(f"TTS queue full, dropping message: {message}")
 
     def stop(self):
         """
         Stop the TeleopsStatusProvider and clean up resources.
+
+        Queued messages that have not been sent yet are discarded. Waits at
+        most STOP_TIMEOUT seconds for an in-flight request. Calling stop()
+        again has no effect.
+        """
+        if self._stop_event.is_set():
+            return
+        self._stop_event.set()
+
+        while True:
+            try:
+                self._pending_messages.get_nowait()
+            except queue.Empty:
+                break
+
+        # The worker also checks the stop event, so a racing add that fills
+        # the freed slot first cannot keep it waiting
+        try:
+            self._pending_messages.put_nowait(None)
+        except queue.Full:
+            pass
+
+        self._worker.join(timeout=STOP_TIMEOUT)
+        if self._worker.is_alive():
+            logging.warning("Ubtech TTS worker did not stop within the timeout")
+        self.session.close()
+
+    def _run(self):
+        """
+        Worker loop that sends queued TTS requests until stopped.
         """
-        self.executor.shutdown(wait=True)
+        while True:
+            item = self._pending_messages.get()
+            if item is None or self._stop_event.is_set():
+                break
+            try:
+                self._speak_workder(*item)
+            except Exception as e:
+                logging.exception(f"Error in TTS worker: {e}")
 
     def _speak_workder(
         self, message: str, interrupt: bool = True, timestamp: int = 0
@@ -74,7 +165,7 @@ class UbTtsProvider:
         """
         payload = {"tts": message, "interrupt": interrupt, "timestamp": timestamp}
         try:
-            response = requests.put(
+            response = self.session.put(
                 url=self.tts_url,
                 data=json.dumps(payload),
                 headers=self.headers,
@@ -94,7 +185,7 @@ class UbTtsProvider:
         """
         try:
             params = {"timestamp": timestamp}
-            response = requests.get(
+            response = self.session.get(
                 url=self.tts_url, headers=self.headers, params=params, timeout=2
             )
             res = response.json()
@@ -1,5 +1,6 @@
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 
 latest_runtime_version = "v1.0.2"
 
@@ -16,6 +17,36 @@ def get_runtime_version() -> str:
     return latest_runtime_version
 
 
+@lru_cache(maxsize=16)
+def _parse_version(version: str) -> Tuple[int, int, int]:
+    """
+    Parse a version string into its major, minor, and patch numbers.
+
+    Missing parts default to zero. Results are cached, so repeated checks of
+    the same version are lookups.
+
+    Parameters
+    ----------
+    version : str
+        The version string to parse, with or without the "v" prefix.
+
+    Returns
+    -------
+    Tuple[int, int, int]
+        The major, minor, and patch numbers.
+    """
+    major, sep, rest = version.lstrip("v").partition(".")
+    minor, sep, rest = rest.partition(".") if sep else ("0", "", "")
+    patch, sep, rest = rest.partition(".") if sep else ("0", "", "")
+
+    # Parts beyond the patch number are ignored but must still be integers
+    if sep:
+        for part in rest.split("."):
+            int(part)
+
+    return int(major), int(minor), int(patch)
+
+
 def is_version_supported(version: Optional[str]) -> bool:
     """
     Check if the given version is supported.
@@ -33,28 +64,20 @@ def is_version_supported(version: Optional[str]) -> bool:
     if version is None:
         raise ValueError("Version cannot be None")
 
-    supported_ver = latest_runtime_version.lstrip("v")
-    input_ver = version.lstrip("v")
-
     try:
-        supported_parts = [int(x) for x in supported_ver.split(".")]
-        input_parts = [int(x) for x in input_ver.split(".")]
-
-        while len(supported_parts) < 3:
-            supported_parts.append(0)
-        while len(input_parts) < 3:
-            input_parts.append(0)
+        supported_major, supported_minor, _ = _parse_version(latest_runtime_version)
+        input_major, input_minor, _ = _parse_version(version)
 
-        if supported_parts[0] != input_parts[0]:
+        if supported_major != input_major:
             raise ValueError(
-                f"Major version mismatch: expected {supported_parts[0]}, "
-                f"got {input_parts[0]}"
+                f"Major version mismatch: expected {supported_major}, "
+                f"got {input_major}"
             )
 
-        if supported_parts[1] != input_parts[1]:
+        if supported_minor != input_minor:
             logging.warning(
-                f"Version mismatch: expected minor version {supported_parts[1]}, "
-                f"got {input_parts[1]}. This may cause compatibility issues."
+                f"Version mismatch: expected minor version {supported_minor}, "
+                f"got {input_minor}. This may cause compatibility issues."
             )
 
         return True
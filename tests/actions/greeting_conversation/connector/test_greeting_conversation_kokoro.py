@@ -0,0 +1,120 @@
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from actions.greeting_conversation.connector.greeting_conversation_kokoro import (
+    GreetingConversationConnector,
+    SpeakKokoroTTSConfig,
+)
+from actions.greeting_conversation.interface import GreetingConversationInput
+from actions.greeting_conversation.speech import SECONDS_PER_WORD
+from providers.greeting_conversation_state_provider import ConversationState
+
+
+@pytest.fixture
+def patched_providers():
+    """Patch the state, context and TTS providers used by the connector."""
+    target = "actions.greeting_conversation.connector.greeting_conversation_kokoro"
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            state=stack.enter_context(
+                patch(f"{target}.GreetingConversationStateMachineProvider")
+            ).return_value,
+            context=stack.enter_context(
+                patch(f"{target}.ContextProvider")
+            ).return_value,
+            tts=stack.enter_context(patch(f"{target}.KokoroTTSProvider")).return_value,
+        )
+
+
+@pytest.fixture
+def connector(patched_providers):
+    """Create a connector with mocked providers and an instant sleep."""
+    connector = GreetingConversationConnector(SpeakKokoroTTSConfig())
+    connector.sleep = MagicMock(return_value=True)
+    return connector
+
+
+def _make_input(response="Hello there, nice to meet you"):
+    return GreetingConversationInput(
+        response=response,
+        conversation_state=ConversationState.CONVERSING,  # type: ignore
+        confidence=0.8,
+        speech_clarity=0.9,
+    )
+
+
+class TestGreetingConversationConnector:
+    """Test the Kokoro greeting conversation connector."""
+
+    def test_init_starts_tts(self, connector, patched_providers):
+        """Test that the connector starts TTS and enters the conversing state."""
+        patched_providers.tts.start.assert_called_once()
+        assert patched_providers.state.current_state == ConversationState.CONVERSING
+        assert connector.tts_duration == 0.0
+
+    @pytest.mark.asyncio
+    async def test_connect_speaks_response(self, connector, patched_providers):
+        """Test that connect queues the response and estimates its duration."""
+        patched_providers.state.process_conversation.return_value = {
+            "current_state": ConversationState.CONVERSING
+        }
+
+        await connector.connect(_make_input())
+
+        patched_providers.tts.add_pending_message.assert_called_once_with(
+            "Hello there, nice to meet you"
+        )
+        assert connector.tts_duration == pytest.approx(6 * SECONDS_PER_WORD)
+        llm_output = patched_providers.state.process_conversation.call_args[0][0]
+        assert llm_output["response"] == "Hello there, nice to meet you"
+        patched_providers.context.update_context.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_connect_finished_updates_context(self, connector, patched_providers):
+        """Test that a finished conversation is reported to the context."""
+        patched_providers.state.process_conversation.return_value = {
+            "current_state": ConversationState.FINISHED
+        }
+
+        await connector.connect(_make_input("Goodbye"))
+
+        patched_providers.context.update_context.assert_called_once_with(
+            {"greeting_conversation_finished": True}
+        )
+
+    def test_tick_skips_during_tts(self, connector, patched_providers):
+        """Test that tick leaves the state alone while TTS is still playing."""
+        connector.tts_duration = 60.0
+
+        connector.tick()
+
+        connector.sleep.assert_called_once_with(10)
+        patched_providers.state.update_state_without_llm.assert_not_called()
+
+    def test_tick_updates_state(self, connector, patched_providers):
+        """Test that tick updates the state once TTS has finished."""
+        patched_providers.state.update_state_without_llm.return_value = {
+            "current_state": ConversationState.CONVERSING.value,
+            "confidence": {"overall": 0.5},
+            "silence_duration": 2.0,
+        }
+
+        connector.tick()
+
+        patched_providers.state.update_state_without_llm.assert_called_once()
+        patched_providers.context.update_context.assert_not_called()
+
+    def test_tick_finished_updates_context(self, connector, patched_providers):
+        """Test that tick reports a conversation that finished while idle."""
+        patched_providers.state.update_state_without_llm.return_value = {
+            "current_state": ConversationState.FINISHED.value,
+        }
+
+        connector.tick()
+
+        patched_providers.context.update_context.assert_called_once_with(
+            {"greeting_conversation_finished": True}
+        )
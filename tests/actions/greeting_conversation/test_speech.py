@@ -0,0 +1,23 @@
+import pytest
+
+from actions.greeting_conversation.speech import (
+    SECONDS_PER_WORD,
+    estimate_speech_duration,
+)
+
+
+@pytest.mark.parametrize(
+    "text,word_count",
+    [
+        ("", 0),
+        ("Hello", 1),
+        ("Hello there", 2),
+        ("Hello there, nice to meet you", 6),
+    ],
+    ids=["empty", "one_word", "two_words", "sentence"],
+)
+def test_estimate_speech_duration(text, word_count):
+    """Test that the duration is the space-separated word count times the rate."""
+    assert estimate_speech_duration(text) == pytest.approx(
+        word_count * SECONDS_PER_WORD
+    )
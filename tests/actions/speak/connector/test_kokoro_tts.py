@@ -1,5 +1,6 @@
 import sys
-import time
+from contextlib import ExitStack
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -12,6 +13,16 @@ from actions.speak.interface import SpeakInput  # noqa: E402
 from zenoh_msgs import AudioStatus, String  # noqa: E402
 
 
+class _ZenohSessionSpec:
+    """Attribute spec for the mock Zenoh session used by the connector."""
+
+    def declare_publisher(self, *args, **kwargs): ...
+
+    def declare_subscriber(self, *args, **kwargs): ...
+
+    def close(self): ...
+
+
 @pytest.fixture(autouse=True, scope="session")
 def mock_zenoh_module():
     """Mock the zenoh module before any imports."""
@@ -34,15 +45,15 @@ def mock_om1_speech_module():
         del sys.modules["om1_speech"]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_config():
-    """Create a default config for testing."""
+    """Create a default config shared by the read-only tests."""
     return SpeakKokoroTTSConfig()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def custom_config():
-    """Create a custom config for testing."""
+    """Create a custom config shared by the read-only tests."""
     return SpeakKokoroTTSConfig(
         voice_id="custom_voice",
         model_id="custom_model",
@@ -54,23 +65,13 @@ def custom_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def speak_input():
-    """Create a SpeakInput instance for testing."""
+    """Create a SpeakInput instance shared by the read-only tests."""
     return SpeakInput(action="Hello, world!")
 
 
 @pytest.fixture
-def mock_zenoh_session():
-    """Create a mock Zenoh session."""
-    session = Mock()
-    session.declare_publisher.return_value = Mock()
-    session.declare_subscriber.return_value = Mock()
-    session.close = Mock()
-    return session
-
-
-@pytest.fixture(autouse=True)
 def reset_mocks(mock_om1_speech_module, mock_zenoh_module):
     """Reset all mock objects between tests."""
     mock_om1_speech_module.AudioOutputLiveStream.reset_mock()
@@ -79,67 +80,129 @@ def reset_mocks(mock_om1_speech_module, mock_zenoh_module):
     yield
 
 
+@pytest.fixture
+def patched_kokoro(reset_mocks):
+    """Patch the connector's Zenoh session and provider dependencies."""
+    target = "actions.speak.connector.kokoro_tts"
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            open_zenoh_session=stack.enter_context(
+                patch(
+                    f"{target}.open_zenoh_session",
+                    return_value=Mock(spec=_ZenohSessionSpec),
+                )
+            ),
+            tts_provider=stack.enter_context(patch(f"{target}.KokoroTTSProvider")),
+            io_provider=stack.enter_context(patch(f"{target}.IOProvider")),
+            conversation_provider=stack.enter_context(
+                patch(f"{target}.TeleopsConversationProvider")
+            ),
+        )
+
+
+@pytest.fixture
+def patched_tts_status(patched_kokoro):
+    """Patch the TTS status request and response message classes."""
+    target = "actions.speak.connector.kokoro_tts"
+    with ExitStack() as stack:
+        yield SimpleNamespace(
+            request_cls=stack.enter_context(patch(f"{target}.TTSStatusRequest")),
+            response_cls=stack.enter_context(patch(f"{target}.TTSStatusResponse")),
+        )
+
+
+@pytest.fixture
+def mock_providers(patched_kokoro):
+    """Install ready-made TTS, IO and conversation provider instances."""
+    tts = Mock()
+    tts.create_pending_message.return_value = {
+        "id": "test_id",
+        "text": "Hello, world!",
+    }
+    tts.serialize_pending_message.return_value = (
+        '{"id": "test_id", "text": "Hello, world!"}'
+    )
+    patched_kokoro.tts_provider.return_value = tts
+
+    io = Mock()
+    io.llm_prompt = "INPUT: Voice: Hello"
+    patched_kokoro.io_provider.return_value = io
+
+    conv = Mock()
+    patched_kokoro.conversation_provider.return_value = conv
+
+    return SimpleNamespace(tts=tts, io=io, conv=conv)
+
+
+@pytest.fixture
+def mock_zenoh_session(patched_kokoro):
+    """Return the mock Zenoh session handed out by the patched opener."""
+    return patched_kokoro.open_zenoh_session.return_value
+
+
 class TestSpeakKokoroTTSConfig:
     """Test the configuration class."""
 
-    def test_default_config(self):
-        """Test default configuration values."""
-        config = SpeakKokoroTTSConfig()
-
-        assert config.voice_id == "af_bella"
-        assert config.model_id == "kokoro"
-        assert config.output_format == "pcm"
-        assert config.rate == 24000
-        assert config.enable_tts_interrupt is False
-        assert config.silence_rate == 0
-
-    def test_custom_config(self):
-        """Test custom configuration values."""
-        config = SpeakKokoroTTSConfig(
-            voice_id="test_voice",
-            model_id="test_model",
-            output_format="wav",
-            rate=48000,
-            enable_tts_interrupt=True,
-            silence_rate=5,
-        )
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            (
+                {},
+                {
+                    "voice_id": "af_bella",
+                    "model_id": "kokoro",
+                    "output_format": "pcm",
+                    "rate": 24000,
+                    "enable_tts_interrupt": False,
+                    "silence_rate": 0,
+                },
+            ),
+            (
+                {
+                    "voice_id": "test_voice",
+                    "model_id": "test_model",
+                    "output_format": "wav",
+                    "rate": 48000,
+                    "enable_tts_interrupt": True,
+                    "silence_rate": 5,
+                },
+                {
+                    "voice_id": "test_voice",
+                    "model_id": "test_model",
+                    "output_format": "wav",
+                    "rate": 48000,
+                    "enable_tts_interrupt": True,
+                    "silence_rate": 5,
+                },
+            ),
+        ],
+        ids=["default", "custom"],
+    )
+    def test_config(self, kwargs, expected):
+        """Test default and custom configuration values."""
+        config = SpeakKokoroTTSConfig(**kwargs)
 
-        assert config.voice_id == "test_voice"
-        assert config.model_id == "test_model"
-        assert config.output_format == "wav"
-        assert config.rate == 48000
-        assert config.enable_tts_interrupt is True
-        assert config.silence_rate == 5
+        assert {key: getattr(config, key) for key in expected} == expected
 
 
 class TestSpeakKokoroTTSConnector:
     """Test the Kokoro TTS connector."""
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     def test_init_with_default_config(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        patched_kokoro,
+        mock_providers,
         default_config,
         mock_zenoh_session,
     ):
         """Test initialization with default configuration."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_instance = Mock()
-        mock_tts_provider.return_value = mock_tts_instance
-
         connector = SpeakKokoroTTSConnector(default_config)
 
-        mock_open_zenoh_session.assert_called_once()
+        patched_kokoro.open_zenoh_session.assert_called_once()
         assert mock_zenoh_session.declare_publisher.call_count == 2
         assert mock_zenoh_session.declare_subscriber.call_count == 2
 
-        mock_tts_provider.assert_called_once_with(
+        patched_kokoro.tts_provider.assert_called_once_with(
             url="http://127.0.0.1:8880/v1",
             api_key=None,
             voice_id="af_bella",
@@ -149,35 +212,23 @@ class TestSpeakKokoroTTSConnector:
             enable_tts_interrupt=False,
         )
 
-        mock_tts_instance.start.assert_called_once()
-        mock_tts_instance.configure.assert_called_once()
+        mock_providers.tts.start.assert_called_once()
+        mock_providers.tts.configure.assert_called_once()
 
         assert connector.silence_rate == 0
         assert connector.silence_counter == 0
         assert connector.tts_enabled is True
         assert connector.session == mock_zenoh_session
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     def test_init_with_custom_config(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        patched_kokoro,
         custom_config,
-        mock_zenoh_session,
     ):
         """Test initialization with custom configuration."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_instance = Mock()
-        mock_tts_provider.return_value = mock_tts_instance
-
         connector = SpeakKokoroTTSConnector(custom_config)
 
-        mock_tts_provider.assert_called_once_with(
+        patched_kokoro.tts_provider.assert_called_once_with(
             url="http://127.0.0.1:8880/v1",
             api_key="test_api_key",
             voice_id="custom_voice",
@@ -189,193 +240,144 @@ class TestSpeakKokoroTTSConnector:
 
         assert connector.silence_rate == 2
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     def test_init_zenoh_failure(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        patched_kokoro,
         default_config,
     ):
         """Test initialization when Zenoh session fails to open."""
-        mock_open_zenoh_session.side_effect = Exception("Zenoh connection failed")
+        patched_kokoro.open_zenoh_session.side_effect = Exception(
+            "Zenoh connection failed"
+        )
 
         connector = SpeakKokoroTTSConnector(default_config)
 
         assert connector.session is None
         assert connector.audio_pub is None
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     @pytest.mark.asyncio
     async def test_connect_tts_enabled(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        mock_providers,
         default_config,
         mock_zenoh_session,
         speak_input,
     ):
         """Test connect method when TTS is enabled."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_instance = Mock()
-        mock_tts_instance.create_pending_message.return_value = {
-            "id": "test_id",
-            "text": "Hello, world!",
-        }
-        mock_tts_provider.return_value = mock_tts_instance
         mock_audio_pub = Mock()
         mock_zenoh_session.declare_publisher.return_value = mock_audio_pub
 
-        mock_io_instance = Mock()
-        mock_io_instance.llm_prompt = "INPUT: Voice: Hello"
-        mock_io_provider.return_value = mock_io_instance
-
-        mock_conversation_instance = Mock()
-        mock_conversation_provider.return_value = mock_conversation_instance
-
         connector = SpeakKokoroTTSConnector(default_config)
-        connector.io_provider = mock_io_instance
-        connector.conversation_provider = mock_conversation_instance
 
         await connector.connect(speak_input)
 
-        mock_tts_instance.create_pending_message.assert_called_once_with(
-            "Hello, world!"
-        )
-        mock_conversation_instance.store_robot_message.assert_called_once_with(
+        mock_providers.tts.create_pending_message.assert_called_once_with(
             "Hello, world!"
         )
+        mock_providers.conv.store_robot_message.assert_called_once_with("Hello, world!")
         mock_audio_pub.put.assert_called()
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
+    @pytest.mark.asyncio
+    async def test_connect_reuses_audio_status(
+        self,
+        mock_providers,
+        default_config,
+        speak_input,
+    ):
+        """Test that connect mutates the reusable AudioStatus message."""
+        mock_providers.tts.create_pending_message.return_value = {
+            "text": "Hello, world!",
+        }
+        mock_providers.tts.serialize_pending_message.return_value = (
+            '{"text": "Hello, world!"}'
+        )
+
+        connector = SpeakKokoroTTSConnector(default_config)
+        scratch = connector._scratch_audio_status
+
+        await connector.connect(speak_input)
+
+        assert connector._scratch_audio_status is scratch
+        assert scratch.status_speaker == AudioStatus.STATUS_SPEAKER.ACTIVE.value
+        assert scratch.sentence_to_speak.data == '{"text": "Hello, world!"}'
+
     @pytest.mark.asyncio
     async def test_connect_tts_disabled(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        mock_providers,
         default_config,
-        mock_zenoh_session,
         speak_input,
     ):
         """Test connect method when TTS is disabled."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_instance = Mock()
-        mock_tts_provider.return_value = mock_tts_instance
-
         connector = SpeakKokoroTTSConnector(default_config)
         connector.tts_enabled = False
 
         await connector.connect(speak_input)
 
-        mock_tts_instance.create_pending_message.assert_not_called()
+        mock_providers.tts.create_pending_message.assert_not_called()
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     @pytest.mark.asyncio
     async def test_connect_silence_rate_skip(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
-        mock_zenoh_session,
+        mock_providers,
         speak_input,
     ):
         """Test connect method with silence rate causing skip."""
         config = SpeakKokoroTTSConfig(silence_rate=2)
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_instance = Mock()
-        mock_tts_instance.create_pending_message.return_value = {
-            "id": "test_id",
-            "text": "Hello, world!",
-        }
-        mock_tts_provider.return_value = mock_tts_instance
-
-        mock_io_instance = Mock()
-        mock_io_instance.llm_prompt = "INPUT: Text: Hello"
-        mock_io_provider.return_value = mock_io_instance
+        mock_providers.io.llm_prompt = "INPUT: Text: Hello"
 
         connector = SpeakKokoroTTSConnector(config)
-        connector.io_provider = mock_io_instance
 
         await connector.connect(speak_input)
         assert connector.silence_counter == 1
-        mock_tts_instance.create_pending_message.assert_not_called()
+        mock_providers.tts.create_pending_message.assert_not_called()
 
         await connector.connect(speak_input)
         assert connector.silence_counter == 2
-        mock_tts_instance.create_pending_message.assert_not_called()
+        mock_providers.tts.create_pending_message.assert_not_called()
 
         await connector.connect(speak_input)
         assert connector.silence_counter == 0
-        mock_tts_instance.create_pending_message.assert_called_once()
+        mock_providers.tts.create_pending_message.assert_called_once()
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     @pytest.mark.asyncio
     async def test_connect_without_audio_publisher(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        mock_providers,
         default_config,
-        mock_zenoh_session,
         speak_input,
     ):
         """Test connect method when audio publisher is None."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_instance = Mock()
-        mock_tts_instance.create_pending_message.return_value = {
-            "id": "test_id",
-            "text": "Hello, world!",
-        }
-        mock_tts_provider.return_value = mock_tts_instance
-
         connector = SpeakKokoroTTSConnector(default_config)
         connector.audio_pub = None
 
         await connector.connect(speak_input)
 
-        mock_tts_instance.add_pending_message.assert_called_once_with(
+        mock_providers.tts.add_pending_message.assert_called_once_with(
             {"id": "test_id", "text": "Hello, world!"}
         )
+        mock_providers.tts.serialize_pending_message.assert_not_called()
+
+    def test_publish_audio_status_without_audio_publisher(
+        self,
+        patched_kokoro,
+        default_config,
+    ):
+        """Test that publishing without an audio publisher is a no-op."""
+        connector = SpeakKokoroTTSConnector(default_config)
+        connector.audio_pub = None
+        connector._last_published_audio = None
+
+        connector._publish_audio_status(connector.audio_status)
+
+        assert connector._last_published_audio is None
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     def test_zenoh_audio_message(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        patched_kokoro,
         default_config,
-        mock_zenoh_session,
     ):
         """Test processing of Zenoh audio status messages."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_provider.return_value = Mock()
-
         connector = SpeakKokoroTTSConnector(default_config)
 
         mock_sample = Mock()
@@ -392,115 +394,51 @@ class TestSpeakKokoroTTSConnector:
             mock_audio_status_class.deserialize.assert_called_once_with(b"test_data")
             assert connector.audio_status == mock_audio_status
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
-    def test_zenoh_tts_status_request_enable(
+    def test_zenoh_audio_message_skips_own_publication(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        patched_kokoro,
         default_config,
-        mock_zenoh_session,
     ):
-        """Test TTS status request to enable TTS."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_provider.return_value = Mock()
-        mock_response_pub = Mock()
-
+        """Test that echoes of our own audio status are not deserialized."""
         connector = SpeakKokoroTTSConnector(default_config)
-        connector._zenoh_tts_status_response_pub = mock_response_pub
-        connector.tts_enabled = False
+        audio_pub = connector.audio_pub
+        assert isinstance(audio_pub, Mock)
+        published = audio_pub.put.call_args[0][0]
+        audio_status = connector.audio_status
 
         mock_sample = Mock()
-        mock_sample.payload.to_bytes.return_value = b"test_data"
-
-        mock_header = Mock()
-        mock_header.frame_id = "test_frame"
-
-        mock_tts_status = Mock()
-        mock_tts_status.code = 1  # Enable TTS
-        mock_tts_status.request_id = String("test_request_id")
-        mock_tts_status.header = mock_header
+        mock_sample.payload.to_bytes.return_value = published
 
         with patch(
-            "actions.speak.connector.kokoro_tts.TTSStatusRequest"
-        ) as mock_request_class:
-            with patch("actions.speak.connector.kokoro_tts.TTSStatusResponse"):
-                mock_request_class.deserialize.return_value = mock_tts_status
-
-                connector._zenoh_tts_status_request(mock_sample)
-
-                assert connector.tts_enabled is True
-                mock_response_pub.put.assert_called_once()
-
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
-    def test_zenoh_tts_status_request_disable(
-        self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
-        default_config,
-        mock_zenoh_session,
-    ):
-        """Test TTS status request to disable TTS."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_provider.return_value = Mock()
-        mock_response_pub = Mock()
-
-        connector = SpeakKokoroTTSConnector(default_config)
-        connector._zenoh_tts_status_response_pub = mock_response_pub
-        connector.tts_enabled = True
-
-        mock_sample = Mock()
-        mock_sample.payload.to_bytes.return_value = b"test_data"
-
-        mock_header = Mock()
-        mock_header.frame_id = "test_frame"
-
-        mock_tts_status = Mock()
-        mock_tts_status.code = 0  # Disable TTS
-        mock_tts_status.request_id = String("test_request_id")
-        mock_tts_status.header = mock_header
-
-        with patch(
-            "actions.speak.connector.kokoro_tts.TTSStatusRequest"
-        ) as mock_request_class:
-            with patch("actions.speak.connector.kokoro_tts.TTSStatusResponse"):
-                mock_request_class.deserialize.return_value = mock_tts_status
-
-                connector._zenoh_tts_status_request(mock_sample)
+            "actions.speak.connector.kokoro_tts.AudioStatus"
+        ) as mock_audio_status_class:
+            connector.zenoh_audio_message(mock_sample)
 
-                assert connector.tts_enabled is False
-                mock_response_pub.put.assert_called_once()
+            mock_audio_status_class.deserialize.assert_not_called()
+            assert connector.audio_status is audio_status
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
-    def test_zenoh_tts_status_request_read(
+    @pytest.mark.parametrize(
+        "code, initial_enabled, expected_enabled",
+        [
+            (1, False, True),  # Enable TTS
+            (0, True, False),  # Disable TTS
+            (2, True, True),  # Read status
+        ],
+    )
+    def test_zenoh_tts_status_request(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        patched_tts_status,
         default_config,
-        mock_zenoh_session,
+        code,
+        initial_enabled,
+        expected_enabled,
     ):
-        """Test TTS status request to read current status."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_provider.return_value = Mock()
+        """Test TTS status requests to enable, disable and read TTS."""
         mock_response_pub = Mock()
 
         connector = SpeakKokoroTTSConnector(default_config)
         connector._zenoh_tts_status_response_pub = mock_response_pub
-        connector.tts_enabled = True
+        connector.tts_enabled = initial_enabled
 
         mock_sample = Mock()
         mock_sample.payload.to_bytes.return_value = b"test_data"
@@ -509,86 +447,54 @@ class TestSpeakKokoroTTSConnector:
         mock_header.frame_id = "test_frame"
 
         mock_tts_status = Mock()
-        mock_tts_status.code = 2  # Read status
+        mock_tts_status.code = code
         mock_tts_status.request_id = String("test_request_id")
         mock_tts_status.header = mock_header
 
-        with patch(
-            "actions.speak.connector.kokoro_tts.TTSStatusRequest"
-        ) as mock_request_class:
-            with patch("actions.speak.connector.kokoro_tts.TTSStatusResponse"):
-                mock_request_class.deserialize.return_value = mock_tts_status
+        patched_tts_status.request_cls.deserialize.return_value = mock_tts_status
 
-                connector._zenoh_tts_status_request(mock_sample)
+        connector._zenoh_tts_status_request(mock_sample)
 
-                assert connector.tts_enabled is True
-                mock_response_pub.put.assert_called_once()
+        assert connector.tts_enabled is expected_enabled
+        mock_response_pub.put.assert_called_once()
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     def test_stop(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        mock_providers,
         default_config,
         mock_zenoh_session,
     ):
         """Test stopping the connector."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_instance = Mock()
-        mock_tts_provider.return_value = mock_tts_instance
-
         connector = SpeakKokoroTTSConnector(default_config)
 
         connector.stop()
 
         mock_zenoh_session.close.assert_called_once()
-        mock_tts_instance.stop.assert_called_once()
+        mock_providers.tts.stop.assert_called_once()
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     def test_stop_no_session(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        patched_kokoro,
+        mock_providers,
         default_config,
     ):
         """Test stopping the connector when session is None."""
-        mock_open_zenoh_session.side_effect = Exception("Failed to open session")
-        mock_tts_instance = Mock()
-        mock_tts_provider.return_value = mock_tts_instance
+        patched_kokoro.open_zenoh_session.side_effect = Exception(
+            "Failed to open session"
+        )
 
         connector = SpeakKokoroTTSConnector(default_config)
         connector.stop()
 
-        mock_tts_instance.stop.assert_called_once()
+        mock_providers.tts.stop.assert_called_once()
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     def test_stop_no_tts(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        patched_kokoro,
         default_config,
         mock_zenoh_session,
     ):
         """Test stopping the connector when TTS is None."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_instance = Mock()
-        mock_tts_provider.return_value = mock_tts_instance
-
         connector = SpeakKokoroTTSConnector(default_config)
         connector.tts = None  # type: ignore
 
@@ -596,48 +502,28 @@ class TestSpeakKokoroTTSConnector:
 
         mock_zenoh_session.close.assert_called_once()
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     def test_last_voice_command_time_initialization(
         self,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        patched_kokoro,
         default_config,
-        mock_zenoh_session,
     ):
         """Test that last_voice_command_time is initialized."""
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_provider.return_value = Mock()
+        with patch("actions.speak.connector.kokoro_tts.time") as mock_time:
+            mock_time.time.return_value = 1234.5
 
-        start_time = time.time()
-        connector = SpeakKokoroTTSConnector(default_config)
-        end_time = time.time()
+            connector = SpeakKokoroTTSConnector(default_config)
 
-        assert start_time <= connector.last_voice_command_time <= end_time
+        assert connector.last_voice_command_time == 1234.5
 
-    @patch("actions.speak.connector.kokoro_tts.open_zenoh_session")
-    @patch("actions.speak.connector.kokoro_tts.KokoroTTSProvider")
-    @patch("actions.speak.connector.kokoro_tts.IOProvider")
-    @patch("actions.speak.connector.kokoro_tts.TeleopsConversationProvider")
     @patch("actions.speak.connector.kokoro_tts.uuid4")
     def test_audio_status_initialization(
         self,
         mock_uuid4,
-        mock_conversation_provider,
-        mock_io_provider,
-        mock_tts_provider,
-        mock_open_zenoh_session,
+        patched_kokoro,
         default_config,
-        mock_zenoh_session,
     ):
         """Test that audio status is properly initialized."""
         mock_uuid4.return_value = "test-uuid"
-        mock_open_zenoh_session.return_value = mock_zenoh_session
-        mock_tts_provider.return_value = Mock()
 
         with patch(
             "actions.speak.connector.kokoro_tts.prepare_header"
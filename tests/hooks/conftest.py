@@ -0,0 +1,175 @@
+import inspect
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pycollect_makeitem(collector, name, obj):
+    """
+    Run every async hook test in one session-scoped event loop.
+
+    All hook I/O is mocked, so the tests do not need a fresh loop each. The
+    marker is applied before pytest-asyncio builds the test item, which is
+    when it reads the loop scope.
+    """
+    if inspect.iscoroutinefunction(obj):
+        pytest.mark.asyncio(loop_scope="session")(obj)
+
+
+class _MockResponse:
+    """
+    Lightweight stand-in for ``aiohttp.ClientResponse``.
+
+    Hooks only read ``status`` and await ``json()``, so ``json`` is the only
+    mock; entering the response context yields the response itself.
+    """
+
+    __slots__ = ("status", "json")
+
+    def __init__(self, status, json):
+        self.status = status
+        self.json = json
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return None
+
+
+class _MockSession:
+    """
+    Lightweight stand-in for ``aiohttp.ClientSession``.
+
+    Only ``post`` and ``get`` are mocks; the async context-manager methods are
+    plain coroutines since no test inspects them.
+    """
+
+    __slots__ = ("post", "get", "_aexit_side_effect")
+
+    def __init__(self, post, get, aexit_side_effect=None):
+        self.post = post
+        self.get = get
+        self._aexit_side_effect = aexit_side_effect
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        if self._aexit_side_effect is not None:
+            raise self._aexit_side_effect
+        return None
+
+
+@pytest.fixture(scope="module")
+def _patched_client_session():
+    """
+    Replace ``aiohttp.ClientSession`` once per hook test module.
+
+    Module scope keeps the patch from outliving the hook tests.
+    """
+    client_session = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("aiohttp.ClientSession", client_session)
+        yield client_session
+
+
+@pytest.fixture(autouse=True)
+def mock_client_session(_patched_client_session):
+    """
+    Patched ``aiohttp.ClientSession``, reset before every hook test.
+
+    Tests set ``return_value`` to a session built with ``make_session``.
+    """
+    _patched_client_session.reset_mock(return_value=True, side_effect=True)
+    return _patched_client_session
+
+
+@pytest.fixture(scope="session")
+def make_response():
+    """
+    Factory for lightweight mock aiohttp responses.
+
+    ``json()`` returns ``json_data``, or raises ``json_error`` when given.
+    The factory is shared across the session; each call builds a fresh mock.
+    """
+
+    def _make_response(status, json_data=None, json_error=None):
+        if json_error:
+            json = AsyncMock(side_effect=json_error)
+        else:
+            json = AsyncMock(return_value=json_data)
+        return _MockResponse(status, json)
+
+    return _make_response
+
+
+@pytest.fixture(scope="session")
+def make_session():
+    """
+    Factory for lightweight mock aiohttp client sessions.
+
+    ``post`` and ``get`` set the returned response, while ``post_side_effect``
+    and ``get_side_effect`` accept a sequence of responses or an exception.
+    ``aexit_side_effect`` makes leaving the session context raise.
+    The factory is shared across the session; each call builds a fresh mock.
+    """
+
+    def _make_session(
+        post=None,
+        get=None,
+        post_side_effect=None,
+        get_side_effect=None,
+        aexit_side_effect=None,
+    ):
+        return _MockSession(
+            post=MagicMock(return_value=post, side_effect=post_side_effect),
+            get=MagicMock(return_value=get, side_effect=get_side_effect),
+            aexit_side_effect=aexit_side_effect,
+        )
+
+    return _make_session
+
+
+@pytest.fixture
+def install_session(mock_client_session, make_session):
+    """
+    Build a mock session with ``make_session`` and install it as the session
+    returned by the patched ``aiohttp.ClientSession``.
+
+    Accepts the same keyword arguments as ``make_session`` and returns the
+    installed session for call assertions.
+    """
+
+    def _install_session(**kwargs):
+        mock_session = make_session(**kwargs)
+        mock_client_session.return_value = mock_session
+        return mock_session
+
+    return _install_session
+
+
+@pytest.fixture(scope="module")
+def mock_elevenlabs_provider(request):
+    """
+    Mock ``ElevenLabsTTSProvider`` once per hook test module.
+
+    The patch target is read from the test module's
+    ``ELEVENLABS_PROVIDER_TARGET``, e.g.
+    ``"hooks.nav2_hook.ElevenLabsTTSProvider"``.
+    """
+    provider_instance = Mock()
+    provider_instance.add_pending_message = Mock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            request.module.ELEVENLABS_PROVIDER_TARGET,
+            Mock(return_value=provider_instance),
+        )
+        yield provider_instance
+
+
+@pytest.fixture(autouse=True)
+def reset_elevenlabs_provider(mock_elevenlabs_provider):
+    """Reset calls and configured behaviour on the shared provider mock."""
+    mock_elevenlabs_provider.reset_mock(return_value=True, side_effect=True)
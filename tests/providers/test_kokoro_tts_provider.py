@@ -1,10 +1,32 @@
+import json
 import logging
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from providers.kokoro_tts_provider import KokoroTTSProvider
 
+# Expected AudioOutputLiveStream kwargs for default and custom construction
+DEFAULT_STREAM_KWARGS = {
+    "url": "http://127.0.0.1:8880/v1",
+    "tts_model": "kokoro",
+    "tts_voice": "af_bella",
+    "response_format": "pcm",
+    "rate": 24000,
+    "api_key": None,
+    "enable_tts_interrupt": False,
+}
+CUSTOM_STREAM_KWARGS = {
+    "url": "http://custom:9000/v1",
+    "tts_model": "custom_model",
+    "tts_voice": "custom_voice",
+    "response_format": "wav",
+    "rate": 48000,
+    "api_key": "test-key",
+    "enable_tts_interrupt": True,
+}
+
 
 @pytest.fixture(autouse=True)
 def reset_singleton():
@@ -17,7 +39,9 @@ def reset_singleton():
 @pytest.fixture
 def mock_audio_stream():
     """Fixture for mocked AudioOutputLiveStream."""
-    with patch("providers.kokoro_tts_provider.AudioOutputLiveStream") as mock:
+    mock_om1_speech = MagicMock()
+    with patch.dict(sys.modules, {"om1_speech": mock_om1_speech}):
+        mock = mock_om1_speech.AudioOutputLiveStream
         mock_instance = MagicMock()
         mock_instance._url = "http://127.0.0.1:8880/v1"
         mock_instance._pending_requests = MagicMock()
@@ -47,15 +71,7 @@ class TestKokoroTTSProviderInit:
         assert provider._output_format == "pcm"
         assert provider._enable_tts_interrupt is False
 
-        mock_audio_stream.assert_called_once_with(
-            url="http://127.0.0.1:8880/v1",
-            tts_model="kokoro",
-            tts_voice="af_bella",
-            response_format="pcm",
-            rate=24000,
-            api_key=None,
-            enable_tts_interrupt=False,
-        )
+        mock_audio_stream.assert_called_once_with(**DEFAULT_STREAM_KWARGS)
 
     def test_init_custom_parameters(self, mock_audio_stream):
         """Test initialization with custom parameters."""
@@ -76,15 +92,13 @@ class TestKokoroTTSProviderInit:
         assert provider._output_format == "wav"
         assert provider._enable_tts_interrupt is True
 
-        mock_audio_stream.assert_called_once_with(
-            url="http://custom:9000/v1",
-            tts_model="custom_model",
-            tts_voice="custom_voice",
-            response_format="wav",
-            rate=48000,
-            api_key="test-key",
-            enable_tts_interrupt=True,
-        )
+        mock_audio_stream.assert_called_once_with(**CUSTOM_STREAM_KWARGS)
+
+    def test_init_without_om1_speech(self):
+        """Test that a missing om1_speech package raises a clear error."""
+        with patch.dict(sys.modules, {"om1_speech": None}):
+            with pytest.raises(ImportError, match="om1-modules"):
+                KokoroTTSProvider()
 
 
 class TestKokoroTTSProviderConfigure:
@@ -100,6 +114,23 @@ class TestKokoroTTSProviderConfigure:
         # Should not restart or create new stream
         assert provider._audio_stream is initial_stream
 
+    def test_configure_same_parameters_as_init(self, mock_audio_stream):
+        """Test configure with the construction parameters keeps the stream."""
+        provider = KokoroTTSProvider(url="http://custom:9000/v1", rate=48000)
+        provider._audio_stream._url = None
+
+        provider.configure(url="http://custom:9000/v1", rate=48000)
+
+        mock_audio_stream.assert_called_once()
+
+    def test_configure_with_rate_change(self, provider, mock_audio_stream):
+        """Test configure recreates the stream when only the rate changes."""
+        provider.configure(rate=48000)
+
+        assert provider._rate == 48000
+        assert mock_audio_stream.call_count == 2
+        assert mock_audio_stream.call_args.kwargs["rate"] == 48000
+
     def test_configure_with_changes_while_stopped(self, provider, mock_audio_stream):
         """Test configure with changes while provider is stopped."""
         provider.configure(
@@ -159,6 +190,41 @@ class TestKokoroTTSProviderMessages:
             "output_format": "pcm",
         }
 
+    def test_create_pending_message_returns_independent_dicts(self, provider):
+        """Test that pending messages do not share state with each other."""
+        first = provider.create_pending_message("Hello")
+        first["voice_id"] = "custom_voice"
+
+        second = provider.create_pending_message("World")
+
+        assert second["voice_id"] == "af_bella"
+        assert json.loads(provider.serialize_pending_message(second)) == second
+
+    def test_serialize_pending_message(self, provider):
+        """Test serializing a message with the static TTS parameters."""
+        message = provider.create_pending_message('Say "hi"')
+
+        result = provider.serialize_pending_message(message)
+
+        assert json.loads(result) == message
+
+    def test_serialize_pending_message_custom_fields(self, provider):
+        """Test serializing a message with non-default fields."""
+        message = {"text": "Hello", "voice_id": "custom_voice", "id": "abc"}
+
+        result = provider.serialize_pending_message(message)
+
+        assert json.loads(result) == message
+
+    def test_serialize_pending_message_after_configure(self, provider):
+        """Test that reconfiguring refreshes the pre-serialized fields."""
+        provider.configure(voice_id="new_voice")
+        message = provider.create_pending_message("Hello")
+
+        result = provider.serialize_pending_message(message)
+
+        assert json.loads(result)["voice_id"] == "new_voice"
+
     def test_add_pending_message_as_string(self, provider):
         """Test adding a pending message as string."""
         provider.running = True
@@ -194,6 +260,18 @@ class TestKokoroTTSProviderMessages:
         provider._audio_stream.add_request.assert_not_called()
         assert "TTS provider is not running" in caplog.text
 
+    def test_add_pending_messages_are_sent_separately(self, provider):
+        """Test that consecutive messages are sent as separate requests in order."""
+        provider.running = True
+
+        provider.add_pending_message("Hello there.")
+        provider.add_pending_message("How are you?")
+
+        texts = [
+            c[0][0]["text"] for c in provider._audio_stream.add_request.call_args_list
+        ]
+        assert texts == ["Hello there.", "How are you?"]
+
     def test_get_pending_message_count(self, provider):
         """Test getting pending message count."""
         provider._audio_stream._pending_requests.qsize.return_value = 5
@@ -0,0 +1,67 @@
+import threading
+
+from providers.singleton import singleton
+
+
+def _make_counter_class():
+    """Build a fresh singleton class that counts its __init__ calls."""
+
+    @singleton
+    class Counter:
+        init_calls = 0
+
+        def __init__(self, value=None):
+            type(self).init_calls += 1
+            self.value = value
+
+    return Counter
+
+
+def test_singleton_returns_same_instance():
+    """Test that every call returns the first instance."""
+    Counter = _make_counter_class()
+
+    assert Counter(1) is Counter(2)
+
+
+def test_singleton_does_not_rerun_init():
+    """Test that later calls do not run __init__ again."""
+    Counter = _make_counter_class()
+
+    first = Counter("first")
+    second = Counter("second")
+
+    assert Counter._singleton_class.init_calls == 1  # type: ignore
+    assert second.value == "first"
+    assert first is second
+
+
+def test_singleton_reset_creates_new_instance():
+    """Test that reset() lets the next call build a new instance."""
+    Counter = _make_counter_class()
+
+    first = Counter("first")
+    Counter.reset()  # type: ignore
+    second = Counter("second")
+
+    assert first is not second
+    assert second.value == "second"
+    assert Counter._singleton_class.init_calls == 2  # type: ignore
+
+
+def test_singleton_thread_safe_creation():
+    """Test that concurrent first calls create a single instance."""
+    Counter = _make_counter_class()
+    instances = []
+
+    def create():
+        instances.append(Counter())
+
+    threads = [threading.Thread(target=create) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert Counter._singleton_class.init_calls == 1  # type: ignore
+    assert all(instance is instances[0] for instance in instances)
@@ -1,335 +1,416 @@
-import time
-from concurrent.futures import ThreadPoolExecutor
+import json
+import threading
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
 import requests
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import Timeout as RequestsTimeout
 
-from providers.ub_tts_provider import UbTtsProvider
+from providers.ub_tts_provider import PENDING_QUEUE_SIZE, UbTtsProvider
 
 
-def test_initialization_sets_url():
-    """Test that initialization correctly sets the TTS URL."""
+@pytest.fixture(scope="module")
+def make_response():
+    """Factory for mock TTS service responses with the given JSON fields."""
+
+    def _make_response(code=0, **fields):
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"code": code, **fields}
+        return mock_response
+
+    return _make_response
+
+
+@pytest.fixture(scope="module")
+def provider():
+    """
+    Shared provider for tests that inspect it or patch its session per test.
+
+    Tests that stop the worker or fill the queue build their own.
+    """
     provider = UbTtsProvider("http://localhost:8080/tts")
-    assert provider.tts_url == "http://localhost:8080/tts"
+    yield provider
     provider.stop()
 
 
-def test_initialization_sets_headers():
+@pytest.fixture
+def make_provider():
+    """Factory for providers that are stopped when the test ends."""
+    providers = []
+
+    def _make_provider():
+        provider = UbTtsProvider("http://localhost:8080/tts")
+        providers.append(provider)
+        return provider
+
+    yield _make_provider
+    for provider in providers:
+        provider.stop()
+
+
+@pytest.fixture
+def http(provider, monkeypatch):
+    """Stub the shared provider's session ``put`` and ``get`` for one test."""
+    stubs = SimpleNamespace(put=MagicMock(), get=MagicMock())
+    monkeypatch.setattr(provider.session, "put", stubs.put)
+    monkeypatch.setattr(provider.session, "get", stubs.get)
+    return stubs
+
+
+def test_initialization_sets_url(provider):
+    """Test that initialization correctly sets the TTS URL."""
+    assert provider.tts_url == "http://localhost:8080/tts"
+
+
+def test_initialization_sets_headers(provider):
     """Test that initialization sets correct headers."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
     assert provider.headers == {"Content-Type": "application/json"}
-    provider.stop()
 
 
-def test_initialization_creates_executor():
-    """Test that initialization creates a ThreadPoolExecutor."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
-    assert isinstance(provider.executor, ThreadPoolExecutor)
-    provider.stop()
+def test_initialization_starts_worker(provider):
+    """Test that initialization starts the persistent worker thread."""
+    assert provider._worker.is_alive()
+    assert provider._pending_messages.maxsize == PENDING_QUEUE_SIZE
 
 
-def test_start_method():
+def test_start_method(provider):
     """Test start method logs appropriately."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
-
     with patch("providers.ub_tts_provider.logging.info") as mock_log:
         provider.start()
         mock_log.assert_called_with("Ubtech TTS Provider started.")
 
+
+def test_stop_method(make_provider):
+    """Test stop method joins the worker thread."""
+    provider = make_provider()
+
     provider.stop()
 
+    assert not provider._worker.is_alive()
 
-def test_stop_method():
-    """Test stop method shuts down executor."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
-    executor_mock = MagicMock()
-    provider.executor = executor_mock
 
-    provider.stop()
+def test_stop_method_is_idempotent(make_provider):
+    """Test that a second stop call returns without closing the session again."""
+    provider = make_provider()
 
-    executor_mock.shutdown.assert_called_once_with(wait=True)
+    with patch.object(provider.session, "close", wraps=provider.session.close) as close:
+        provider.stop()
+        provider.stop()
 
+    close.assert_called_once()
 
-# Tests for async message processing
 
+def test_stop_method_with_full_queue_discards_queued(make_provider):
+    """Test that stop with a full queue only waits for the in-flight message."""
+    provider = make_provider()
+    gate = threading.Event()
+    started = threading.Event()
 
-def test_adding_pending_message_submits_to_executor():
-    """Test that adding_pending_message submits work to the executor."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
-    executor_mock = MagicMock()
-    provider.executor = executor_mock
+    def _speak(*args):
+        started.set()
+        gate.wait(timeout=5)
 
-    provider.adding_pending_message("Hello world")
+    speak = MagicMock(side_effect=_speak)
+    provider._speak_workder = speak
+    provider.adding_pending_message("busy")
+    assert started.wait(timeout=5)
+    for i in range(PENDING_QUEUE_SIZE):
+        provider.adding_pending_message(f"message {i}", timestamp=i)
 
-    executor_mock.submit.assert_called_once()
-    args = executor_mock.submit.call_args[0]
-    assert args[0] == provider._speak_workder
-    assert args[1] == "Hello world"
-    assert args[2] is True  # interrupt default
-    assert args[3] == 0  # timestamp default
+    stopper = threading.Thread(target=provider.stop)
+    stopper.start()
+    assert provider._stop_event.wait(timeout=5)
+    gate.set()
+    stopper.join(timeout=5)
 
-    provider.stop()
+    assert not stopper.is_alive()
+    assert not provider._worker.is_alive()
+    speak.assert_called_once_with("busy", True, 0)
 
 
-def test_adding_pending_message_with_custom_parameters():
-    """Test that adding_pending_message correctly passes custom parameters."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
-    executor_mock = MagicMock()
-    provider.executor = executor_mock
+def test_stop_method_times_out_on_hung_request(make_provider, monkeypatch):
+    """Test that stop gives up waiting for a request that does not return."""
+    monkeypatch.setattr("providers.ub_tts_provider.STOP_TIMEOUT", 0.05)
+    provider = make_provider()
+    gate = threading.Event()
+    started = threading.Event()
+
+    def _speak(*args):
+        started.set()
+        gate.wait(timeout=5)
+
+    provider._speak_workder = MagicMock(side_effect=_speak)
+    provider.adding_pending_message("hung")
+    assert started.wait(timeout=5)
+
+    with patch("providers.ub_tts_provider.logging.warning") as mock_warning:
+        provider.stop()
 
-    provider.adding_pending_message("Custom message", interrupt=False, timestamp=12345)
+    assert provider._worker.is_alive()
+    mock_warning.assert_called_once()
+    assert "did not stop" in mock_warning.call_args[0][0]
 
-    executor_mock.submit.assert_called_once()
-    args = executor_mock.submit.call_args[0]
-    assert args[0] == provider._speak_workder
-    assert args[1] == "Custom message"
-    assert args[2] is False  # interrupt=False
-    assert args[3] == 12345  # timestamp=12345
+    gate.set()
+    provider._worker.join(timeout=5)
+    assert not provider._worker.is_alive()
 
+
+def test_adding_pending_message_after_stop_is_dropped(make_provider):
+    """Test that messages added after stop are not queued."""
+    provider = make_provider()
     provider.stop()
 
+    provider.adding_pending_message("late")
 
-def test_adding_pending_message_integration():
-    """Test integration of adding_pending_message with actual worker."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
+    assert provider._pending_messages.empty()
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"code": 0}
-    mock_response.raise_for_status = MagicMock()
 
-    with patch("providers.ub_tts_provider.requests.put", return_value=mock_response):
-        provider.adding_pending_message("Hello world")
+def test_initialization_creates_session(provider):
+    """Test that initialization creates a requests session."""
+    assert isinstance(provider.session, requests.Session)
 
-        time.sleep(0.1)
 
-    provider.stop()
+def test_initialization_mounts_pooled_adapter(make_provider):
+    """Test that initialization mounts one pooled adapter for HTTP and HTTPS."""
+    with patch("providers.ub_tts_provider.HTTPAdapter") as mock_adapter:
+        provider = make_provider()
 
+    mock_adapter.assert_called_once_with(
+        pool_connections=1, pool_maxsize=4, max_retries=0
+    )
+    assert provider.session.adapters["http://"] is mock_adapter.return_value
+    assert provider.session.adapters["https://"] is mock_adapter.return_value
 
-def test_speak_worker_success():
-    """Test successful TTS speak request through worker."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"code": 0}
-    mock_response.raise_for_status = MagicMock()
+def test_stop_method_closes_session(make_provider):
+    """Test stop method closes the requests session."""
+    provider = make_provider()
 
-    with patch(
-        "providers.ub_tts_provider.requests.put", return_value=mock_response
-    ) as mock_put:
-        result = provider._speak_workder("Hello world")
+    with patch.object(provider.session, "close", wraps=provider.session.close) as close:
+        provider.stop()
 
-        assert result is True
-        mock_put.assert_called_once()
-        call_kwargs = mock_put.call_args[1]
-        assert call_kwargs["url"] == "http://localhost:8080/tts"
-        assert call_kwargs["timeout"] == 5
+    close.assert_called_once()
 
-    provider.stop()
 
+# Tests for async message processing
 
-def test_speak_worker_with_parameters():
-    """Test speak worker with custom interrupt and timestamp parameters."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"code": 0}
-    mock_response.raise_for_status = MagicMock()
+@pytest.fixture
+def stopped_provider(make_provider):
+    """Provider whose worker has exited so queued items stay put."""
+    provider = make_provider()
+    provider._pending_messages.put(None)
+    provider._worker.join()
+    return provider
 
-    with patch(
-        "providers.ub_tts_provider.requests.put", return_value=mock_response
-    ) as mock_put:
-        result = provider._speak_workder("Hello", interrupt=False, timestamp=12345)
 
-        assert result is True
-        call_data = mock_put.call_args[1]["data"]
-        assert '"interrupt": false' in call_data
-        assert '"timestamp": 12345' in call_data
+def test_adding_pending_message_queues_request(stopped_provider):
+    """Test that adding_pending_message queues the request for the worker."""
+    stopped_provider.adding_pending_message("Hello world")
 
-    provider.stop()
+    assert stopped_provider._pending_messages.get_nowait() == ("Hello world", True, 0)
 
 
-def test_speak_worker_default_parameters():
-    """Test speak worker with default parameters."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
+def test_adding_pending_message_with_custom_parameters(stopped_provider):
+    """Test that adding_pending_message correctly passes custom parameters."""
+    stopped_provider.adding_pending_message(
+        "Custom message", interrupt=False, timestamp=12345
+    )
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"code": 0}
-    mock_response.raise_for_status = MagicMock()
+    assert stopped_provider._pending_messages.get_nowait() == (
+        "Custom message",
+        False,
+        12345,
+    )
 
-    with patch(
-        "providers.ub_tts_provider.requests.put", return_value=mock_response
-    ) as mock_put:
-        result = provider._speak_workder("Hello")
 
-        assert result is True
-        call_data = mock_put.call_args[1]["data"]
-        assert '"interrupt": true' in call_data
-        assert '"timestamp": 0' in call_data
+def _drain(provider):
+    """Remove and return every item queued on a stopped provider."""
+    queued = []
+    while not provider._pending_messages.empty():
+        queued.append(provider._pending_messages.get_nowait())
+    return queued
 
-    provider.stop()
 
+def test_adding_pending_message_full_queue_interrupt_drops_oldest(stopped_provider):
+    """Test that an interrupting message replaces the oldest when full."""
+    for i in range(PENDING_QUEUE_SIZE):
+        stopped_provider.adding_pending_message(f"message {i}", timestamp=i)
 
-def test_speak_worker_failure_non_zero_code():
-    """Test speak worker returns False when response code is non-zero."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
+    stopped_provider.adding_pending_message("urgent", interrupt=True, timestamp=99)
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"code": 1, "error": "TTS busy"}
-    mock_response.raise_for_status = MagicMock()
+    queued = _drain(stopped_provider)
+    assert len(queued) == PENDING_QUEUE_SIZE
+    assert queued[0] == ("message 1", True, 1)
+    assert queued[-1] == ("urgent", True, 99)
 
-    with patch("providers.ub_tts_provider.requests.put", return_value=mock_response):
-        result = provider._speak_workder("Hello")
-        assert result is False
 
-    provider.stop()
+def test_adding_pending_message_full_queue_no_interrupt_drops_new(stopped_provider):
+    """Test that a non-interrupting message is dropped when full."""
+    for i in range(PENDING_QUEUE_SIZE):
+        stopped_provider.adding_pending_message(f"message {i}", timestamp=i)
 
+    stopped_provider.adding_pending_message("late", interrupt=False, timestamp=99)
 
-def test_speak_worker_request_exception():
-    """Test speak worker handles request exceptions gracefully."""
+    queued = _drain(stopped_provider)
+    assert len(queued) == PENDING_QUEUE_SIZE
+    assert queued[0] == ("message 0", True, 0)
+    assert ("late", False, 99) not in queued
 
-    provider = UbTtsProvider("http://localhost:8080/tts")
 
-    with (
-        patch(
-            "providers.ub_tts_provider.requests.put",
-            side_effect=requests.exceptions.ConnectionError("Connection refused"),
-        ),
-        patch("providers.ub_tts_provider.logging.error") as mock_log,
-    ):
-        result = provider._speak_workder("Hello")
-        assert result is False
-        mock_log.assert_called_once()
-        assert "Failed to send TTS command" in mock_log.call_args[0][0]
+def test_adding_pending_message_full_queue_keeps_sentinel(stopped_provider):
+    """Test that eviction never discards the stop sentinel."""
+    stopped_provider._pending_messages.put_nowait(None)
+    for i in range(PENDING_QUEUE_SIZE - 1):
+        stopped_provider.adding_pending_message(f"message {i}", timestamp=i)
 
-    provider.stop()
+    stopped_provider.adding_pending_message("urgent", interrupt=True, timestamp=99)
 
+    queued = _drain(stopped_provider)
+    assert None in queued
+    assert ("urgent", True, 99) not in queued
 
-def test_speak_worker_timeout_exception():
-    """Test speak worker handles timeout exceptions gracefully."""
 
-    provider = UbTtsProvider("http://localhost:8080/tts")
+def test_adding_pending_message_integration(make_provider, make_response):
+    """Test integration of adding_pending_message with actual worker."""
+    provider = make_provider()
+    sent = threading.Event()
 
-    with (
-        patch(
-            "providers.ub_tts_provider.requests.put",
-            side_effect=requests.exceptions.Timeout("Request timed out"),
-        ),
-        patch("providers.ub_tts_provider.logging.error") as mock_log,
-    ):
-        result = provider._speak_workder("Hello")
-        assert result is False
-        mock_log.assert_called_once()
+    def _put(*args, **kwargs):
+        sent.set()
+        return make_response()
 
-    provider.stop()
+    with patch.object(provider.session, "put", side_effect=_put) as put:
+        provider.adding_pending_message("Hello world")
+        assert sent.wait(timeout=5)
 
+        provider.stop()
 
-def test_get_status_success():
-    """Test successful status retrieval."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
+    put.assert_called_once()
+    assert json.loads(put.call_args[1]["data"])["tts"] == "Hello world"
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"code": 0, "status": "run"}
 
-    with patch(
-        "providers.ub_tts_provider.requests.get", return_value=mock_response
-    ) as mock_get:
-        result = provider.get_tts_status(12345)
+def test_speak_worker_success(provider, http, make_response):
+    """Test successful TTS speak request through worker."""
+    http.put.return_value = make_response()
 
-        assert result == "run"
-        mock_get.assert_called_once()
-        call_kwargs = mock_get.call_args[1]
-        assert call_kwargs["params"] == {"timestamp": 12345}
-        assert call_kwargs["timeout"] == 2
+    result = provider._speak_workder("Hello world")
 
-    provider.stop()
+    assert result is True
+    http.put.assert_called_once()
+    call_kwargs = http.put.call_args[1]
+    assert call_kwargs["url"] == "http://localhost:8080/tts"
+    assert call_kwargs["timeout"] == 5
 
 
-def test_get_status_all_possible_values():
-    """Test all possible status values."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
+def test_speak_worker_with_parameters(provider, http, make_response):
+    """Test speak worker with custom interrupt and timestamp parameters."""
+    http.put.return_value = make_response()
 
-    statuses = ["build", "wait", "run", "idle"]
+    result = provider._speak_workder("Hello", interrupt=False, timestamp=12345)
 
-    for status in statuses:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"code": 0, "status": status}
+    assert result is True
+    call_data = json.loads(http.put.call_args[1]["data"])
+    assert call_data["interrupt"] is False
+    assert call_data["timestamp"] == 12345
 
-        with patch(
-            "providers.ub_tts_provider.requests.get", return_value=mock_response
-        ):
-            result = provider.get_tts_status(12345)
-            assert result == status
 
-    provider.stop()
+def test_speak_worker_default_parameters(provider, http, make_response):
+    """Test speak worker with default parameters."""
+    http.put.return_value = make_response()
 
+    result = provider._speak_workder("Hello")
 
-def test_get_status_idle():
-    """Test status returns idle when TTS is not active."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
+    assert result is True
+    call_data = json.loads(http.put.call_args[1]["data"])
+    assert call_data["interrupt"] is True
+    assert call_data["timestamp"] == 0
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"code": 0, "status": "idle"}
 
-    with patch("providers.ub_tts_provider.requests.get", return_value=mock_response):
-        result = provider.get_tts_status(0)
-        assert result == "idle"
+def test_speak_worker_failure_non_zero_code(provider, http, make_response):
+    """Test speak worker returns False when response code is non-zero."""
+    http.put.return_value = make_response(code=1, error="TTS busy")
 
-    provider.stop()
+    result = provider._speak_workder("Hello")
+    assert result is False
 
 
-def test_get_status_non_zero_code():
-    """Test status returns error when response code is non-zero."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
+def test_speak_worker_request_exception(provider, http):
+    """Test speak worker handles request exceptions gracefully."""
+    http.put.side_effect = RequestsConnectionError("Connection refused")
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"code": 1}
+    with patch("providers.ub_tts_provider.logging.error") as mock_log:
+        result = provider._speak_workder("Hello")
 
-    with patch("providers.ub_tts_provider.requests.get", return_value=mock_response):
-        result = provider.get_tts_status(12345)
-        assert result == "error"
+    assert result is False
+    mock_log.assert_called_once()
+    assert "Failed to send TTS command" in mock_log.call_args[0][0]
 
-    provider.stop()
 
+def test_speak_worker_timeout_exception(provider, http):
+    """Test speak worker handles timeout exceptions gracefully."""
+    http.put.side_effect = RequestsTimeout("Request timed out")
 
-def test_get_status_request_exception():
-    """Test status returns error on request exception."""
+    with patch("providers.ub_tts_provider.logging.error") as mock_log:
+        result = provider._speak_workder("Hello")
 
-    provider = UbTtsProvider("http://localhost:8080/tts")
+    assert result is False
+    mock_log.assert_called_once()
 
-    with patch(
-        "providers.ub_tts_provider.requests.get",
-        side_effect=requests.exceptions.ConnectionError("Connection refused"),
-    ):
-        result = provider.get_tts_status(12345)
-        assert result == "error"
 
-    provider.stop()
+def test_get_status_success(provider, http, make_response):
+    """Test successful status retrieval."""
+    http.get.return_value = make_response(status="run")
 
+    result = provider.get_tts_status(12345)
 
-def test_get_status_missing_status_field():
-    """Test status returns error when status field is missing."""
-    provider = UbTtsProvider("http://localhost:8080/tts")
+    assert result == "run"
+    http.get.assert_called_once()
+    call_kwargs = http.get.call_args[1]
+    assert call_kwargs["params"] == {"timestamp": 12345}
+    assert call_kwargs["timeout"] == 2
 
-    mock_response = MagicMock()
-    mock_response.json.return_value = {"code": 0}  # No status field
 
-    with patch("providers.ub_tts_provider.requests.get", return_value=mock_response):
-        result = provider.get_tts_status(12345)
-        assert result == "error"
+@pytest.mark.parametrize("status", ["build", "wait", "run", "idle"])
+def test_get_status_all_possible_values(provider, http, make_response, status):
+    """Test all possible status values."""
+    http.get.return_value = make_response(status=status)
 
-    provider.stop()
+    assert provider.get_tts_status(12345) == status
 
 
-def test_get_status_timeout_exception():
-    """Test status returns error on timeout."""
+def test_get_status_idle(provider, http, make_response):
+    """Test status returns idle when TTS is not active."""
+    http.get.return_value = make_response(status="idle")
 
-    provider = UbTtsProvider("http://localhost:8080/tts")
+    assert provider.get_tts_status(0) == "idle"
 
-    with patch(
-        "providers.ub_tts_provider.requests.get",
-        side_effect=requests.exceptions.Timeout("Request timed out"),
-    ):
-        result = provider.get_tts_status(12345)
-        assert result == "error"
 
-    provider.stop()
+def test_get_status_non_zero_code(provider, http, make_response):
+    """Test status returns error when response code is non-zero."""
+    http.get.return_value = make_response(code=1)
+
+    assert provider.get_tts_status(12345) == "error"
+
+
+def test_get_status_request_exception(provider, http):
+    """Test status returns error on request exception."""
+    http.get.side_effect = RequestsConnectionError("Connection refused")
+
+    assert provider.get_tts_status(12345) == "error"
+
+
+def test_get_status_missing_status_field(provider, http, make_response):
+    """Test status returns error when status field is missing."""
+    http.get.return_value = make_response()  # No status field
+
+    assert provider.get_tts_status(12345) == "error"
+
+
+def test_get_status_timeout_exception(provider, http):
+    """Test status returns error on timeout."""
+    http.get.side_effect = RequestsTimeout("Request timed out")
+
+    assert provider.get_tts_status(12345) == "error"